@@ -5,57 +5,133 @@ Install, list, and remove skills across different AI assistants.
 """
 import os
 import sys
-import shutil
-import argparse
+import stat
+import errno
+import time
+import types
+import functools
+import threading
 from pathlib import Path
 
+# Global destination directories, resolved once at import
+_OPENCODE_DEST = Path(os.path.expanduser("~/.config/opencode/skills"))
+_ANTIGRAVITY_GLOBAL_DEST = Path(os.path.expanduser("~/.gemini/antigravity/skills"))
+_CLAUDE_CODE_DEST = Path(os.path.expanduser("~/.claude/skills"))
+
+# Installer directories that are never installed as skills
+_EXCLUDED_DIRS = frozenset({"skills-manager", "antigravity-installer", "opencode-installer"})
+
+# Written into each installed skill; records the source files it was copied from
+_MANIFEST_NAME = ".install-manifest.json"
+
+# Serializes the per-skill output blocks written by worker threads
+_print_lock = threading.Lock()
+
+# Buffer size for the read/write fallback when the kernel cannot copy for us
+_COPY_BUFSIZE = 1024 * 1024
+
+# Kernel copy errors that mean "not supported here", not "copy failed"
+_COPY_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM})
+
+# Whether file metadata can be applied through the open descriptor, avoiding a
+# second path lookup per file (not on Windows)
+_FD_METADATA = hasattr(os, "fchmod") and os.utime in os.supports_fd
+
+# os.link errors that mean "hard links are not possible here", so copy instead
+_LINK_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.EMLINK, errno.EPERM, errno.ENOSYS, errno.EOPNOTSUPP})
+
+# Worker count for the skill and file pools; the work is syscall-bound, not CPU-bound
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Shared executors by name, created on first use so `list` never imports
+# concurrent.futures. "copy" queues individual file copies, so one large skill
+# is copied in parallel; "cleanup" deletes replaced installations in the
+# background while new copies proceed.
+_executors = {}
+_executors_lock = threading.Lock()
+
+# (staging path, future) for each background deletion, checked before exit
+_cleanup_futures = []
+
+def _get_executor(name, max_workers):
+    """Return the shared executor called name, creating it on first use."""
+    with _executors_lock:
+        if name not in _executors:
+            from concurrent.futures import ThreadPoolExecutor
+            _executors[name] = ThreadPoolExecutor(max_workers=max_workers)
+        return _executors[name]
+
+@functools.lru_cache(maxsize=256)
+def _is_dir(path):
+    """Return True if path is a directory, using a single cached stat call."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
 def get_source_skills_dir():
     """Get the source directory containing available skills."""
     script_dir = Path(__file__).resolve().parent
     repo_root = script_dir.parent
     skills_dir = repo_root / "skills"
 
-    if skills_dir.exists() and skills_dir.is_dir():
+    if _is_dir(str(skills_dir)):
         return skills_dir
 
-    if not repo_root.exists() or not repo_root.is_dir():
+    if not _is_dir(str(repo_root)):
         print(f"Error: Could not locate source skills directory at {repo_root}")
         sys.exit(1)
 
     return repo_root
 
+@functools.lru_cache(maxsize=None)
+def _find_workspace_skills_dir(cwd):
+    """Find the .agent/skills directory for the workspace containing cwd."""
+    # Find .agent directory by searching upward from cwd
+    current = Path(cwd)
+    while current != current.parent:
+        agent_dir = current / ".agent"
+        if _is_dir(str(agent_dir)):
+            return agent_dir / "skills"
+        current = current.parent
+    # If not found, use cwd
+    return Path(cwd) / ".agent" / "skills"
+
 def get_dest_skills_dir(target, scope="global"):
     """Get destination directory based on target (opencode/antigravity/claude-code) and scope."""
     if target == "opencode":
         # Open Code only has global scope
-        return Path.home() / ".config" / "opencode" / "skills"
+        return _OPENCODE_DEST
     elif target == "antigravity":
         if scope == "global":
-            return Path.home() / ".gemini" / "antigravity" / "skills"
+            return _ANTIGRAVITY_GLOBAL_DEST
         else:  # workspace
-            # Find .agent directory by searching upward from current directory
-            current = Path.cwd()
-            while current != current.parent:
-                agent_dir = current / ".agent"
-                if agent_dir.exists() and agent_dir.is_dir():
-                    return agent_dir / "skills"
-                current = current.parent
-            # If not found, use current directory
-            return Path.cwd() / ".agent" / "skills"
+            return _find_workspace_skills_dir(os.getcwd())
     elif target == "claude-code":
         # Claude Code only has global scope
-        return Path.home() / ".claude" / "skills"
+        return _CLAUDE_CODE_DEST
     else:
         print(f"Error: Invalid target '{target}'")
         sys.exit(1)
 
+def list_skill_dirs(root, exclude=()):
+    """Return the names of the non-hidden subdirectories of root."""
+    with os.scandir(root) as it:
+        # DirEntry.is_dir() answers from the dirent type, without a stat call
+        return [
+            entry.name for entry in it
+            if entry.name[:1] != "."
+            and entry.name not in exclude
+            and entry.is_dir()
+        ]
+
 def list_installed_skills(dest_root):
     """List all installed skills in the destination directory."""
-    if not dest_root.exists():
+    try:
+        skills = list_skill_dirs(dest_root)
+    except FileNotFoundError:
         print("No skills installed yet (destination directory does not exist).")
         return
-
-    skills = [d.name for d in dest_root.iterdir() if d.is_dir() and not d.name.startswith(".")]
     
     if not skills:
         print("No skills installed.")
@@ -64,49 +140,299 @@ def list_installed_skills(dest_root):
         for skill in sorted(skills):
             print(f"  - {skill}")
 
-def install_skill(skill_name, source_path, dest_path):
+def _sendfile(src_fd, dst_fd, count):
+    """os.sendfile with copy_file_range's argument order, using the current offsets."""
+    return os.sendfile(dst_fd, src_fd, None, count)
+
+# In-kernel copy primitives, tried in order. copy_file_range comes first because
+# it can reflink on CoW filesystems; sendfile covers kernels and filesystems that
+# reject it. Only Linux's sendfile accepts a regular file as the destination.
+_KERNEL_COPIES = ()
+if hasattr(os, "copy_file_range"):
+    _KERNEL_COPIES += (os.copy_file_range,)
+if sys.platform.startswith("linux"):
+    _KERNEL_COPIES += (_sendfile,)
+
+def _copy_fd(src_fd, dst_fd, size):
+    """Copy size bytes between file descriptors, in-kernel when available."""
+    copied = 0
+    for kernel_copy in _KERNEL_COPIES:
+        try:
+            while copied < size:
+                n = kernel_copy(src_fd, dst_fd, size - copied)
+                if n == 0:
+                    break
+                copied += n
+            break
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    # Both offsets have advanced past whatever the kernel copied
+    while True:
+        buf = os.read(src_fd, _COPY_BUFSIZE)
+        if not buf:
+            break
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(dst_fd, view):]
+
+def _copy_file(src, dst, st):
+    """Copy a regular file, mirroring the mode and timestamps of its cached stat."""
+    binary = getattr(os, "O_BINARY", 0)
+    mode = stat.S_IMODE(st.st_mode)
+    times = (st.st_atime_ns, st.st_mtime_ns)
+    src_fd = os.open(src, os.O_RDONLY | binary)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary, 0o600)
+        try:
+            _copy_fd(src_fd, dst_fd, st.st_size)
+            if _FD_METADATA:
+                os.fchmod(dst_fd, mode)
+                os.utime(dst_fd, ns=times)
+        finally:
+            os.close(dst_fd)
+        if not _FD_METADATA:
+            os.chmod(dst, mode)
+            os.utime(dst, ns=times)
+    finally:
+        os.close(src_fd)
+
+def _link_or_copy_file(src, dst, st):
+    """Hard link a regular file, falling back to a copy where linking fails."""
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno not in _LINK_FALLBACK_ERRNOS:
+            raise
+        _copy_file(src, dst, st)
+
+def _fast_copytree(src, dst, link=False):
+    """Copy a directory tree using os.scandir and low-level file copies.
+
+    With link=True regular files are hard linked instead of copied. Regular
+    files are handed to the shared file-copy pool as they are discovered.
+    Returns (manifest, dirs). The manifest maps each copied file's relative
+    path to its [size, mtime_ns, mode], and each directory's relative path
+    (ending in "/", with "./" for the root) to its [mode]. dirs lists the
+    (destination, source stat) pairs to pass to _apply_dir_metadata once
+    nothing more will be written into the tree.
+    """
+    import shutil
+    from concurrent.futures import wait
+
+    copy_file = _link_or_copy_file if link else _copy_file
+    copy_executor = _get_executor("copy", _MAX_WORKERS)
+    pending = []
+    os.makedirs(dst)
+    root_st = os.stat(src)
+    manifest = {"./": [stat.S_IMODE(root_st.st_mode)]}
+    dirs = [(os.fspath(dst), root_st)]
+    stack = [(os.fspath(src), os.fspath(dst), "")]
+    while stack:
+        src_dir, dst_dir, rel = stack.pop()
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                # Symlinked directories are followed, as shutil.copytree does
+                if entry.is_dir():
+                    st = entry.stat()
+                    os.mkdir(target)
+                    dirs.append((target, st))
+                    stack.append((entry.path, target, rel + entry.name + "/"))
+                    manifest[rel + entry.name + "/"] = [stat.S_IMODE(st.st_mode)]
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    pending.append(copy_executor.submit(copy_file, entry.path, target, st))
+                else:
+                    st = entry.stat()
+                    shutil.copy2(entry.path, target)
+                manifest[rel + entry.name] = [st.st_size, st.st_mtime_ns, stat.S_IMODE(st.st_mode)]
+    # Let every copy finish before reporting the first failure
+    wait(pending)
+    for future in pending:
+        future.result()
+    return manifest, dirs
+
+def _apply_dir_metadata(dirs):
+    """Mirror source directory modes and times onto a finished copy."""
+    # Directory metadata goes last: adding entries would bump the mtime, and a
+    # read-only mode would block the copies and the manifest write
+    for dst_dir, st in dirs:
+        os.chmod(dst_dir, stat.S_IMODE(st.st_mode))
+        os.utime(dst_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+def _tree_manifest(root):
+    """Build the same manifest as _fast_copytree for root, without copying."""
+    manifest = {"./": [stat.S_IMODE(os.stat(root).st_mode)]}
+    stack = [(os.fspath(root), "")]
+    while stack:
+        path, rel = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                st = entry.stat()
+                if entry.is_dir():
+                    stack.append((entry.path, rel + entry.name + "/"))
+                    manifest[rel + entry.name + "/"] = [stat.S_IMODE(st.st_mode)]
+                else:
+                    manifest[rel + entry.name] = [st.st_size, st.st_mtime_ns, stat.S_IMODE(st.st_mode)]
+    return manifest
+
+def _read_manifest(dest_path):
+    """Return the manifest stored in an installed skill, or None."""
+    import json
+    try:
+        with open(dest_path / _MANIFEST_NAME, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_manifest(dest_path, link, files):
+    """Record how and from which source files a skill was installed."""
+    import json
+    with open(dest_path / _MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump({"link": link, "files": files}, f)
+
+def _rmtree_contents(path):
+    """Delete everything inside a directory, leaving the directory itself."""
+    with os.scandir(path) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            _rmtree_dir(entry.path)
+        else:
+            os.unlink(entry.path)
+
+def _rmtree_dir(path):
+    """Delete a real directory and everything below it."""
+    try:
+        _rmtree_contents(path)
+    except PermissionError:
+        # Installs mirror source modes, so a copied read-only directory
+        # blocks deleting its own entries until it is made writable
+        os.chmod(path, stat.S_IRWXU)
+        _rmtree_contents(path)
+    os.rmdir(path)
+
+def _fast_rmtree(path):
+    """Delete a directory tree using the entry types os.scandir already knows."""
+    if stat.S_ISLNK(os.lstat(path).st_mode):
+        raise OSError(f"Cannot remove a symbolic link as a tree: {path}")
+    _rmtree_dir(os.fspath(path))
+
+def same_filesystem(path_a, path_b):
+    """Return True if both existing paths live on the same device."""
+    return os.stat(path_a).st_dev == os.stat(path_b).st_dev
+
+def install_skill(skill_name, source_path, dest_path, link=False, force=False, log=print):
     """Install a single skill."""
-    print(f"Installing '{skill_name}'...")
+    log(f"Installing '{skill_name}'...")
     
-    if not source_path.exists():
-        print(f"  Warning: Source skill '{skill_name}' not found at {source_path}. Skipping.")
+    if not _is_dir(str(source_path)):
+        log(f"  Warning: Source skill '{skill_name}' not found at {source_path}. Skipping.")
         return False
 
     try:
-        # 1. Remove destination if it exists (Overwrite behavior)
-        if dest_path.exists():
-            print(f"  Removing existing installation at {dest_path}")
-            shutil.rmtree(dest_path)
+        # 0. Skip the copy when the source files match the previous install
+        installed = None if force else _read_manifest(dest_path)
+        if installed is not None and installed == {"link": link, "files": _tree_manifest(source_path)}:
+            log(f"  ✅ Already up-to-date at {dest_path}")
+            return True
+
+        # 1. Move any existing installation aside and delete it in the background
+        #    (Overwrite behavior). The hidden staging name is skipped by list.
+        staging = dest_path.parent / f".{dest_path.name}.old.{os.getpid()}.{time.time_ns()}"
+        try:
+            os.rename(dest_path, staging)
+            log(f"  Removing existing installation at {dest_path}")
+            if stat.S_ISDIR(os.lstat(staging).st_mode):
+                future = _get_executor("cleanup", 4).submit(_fast_rmtree, staging)
+                _cleanup_futures.append((staging, future))
+            else:
+                # A symlinked skill or stray file: only the entry itself goes
+                os.unlink(staging)
+        except FileNotFoundError:
+            pass
         
-        # 2. Create parent directory if needed
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-            
-        # 3. Copy source to destination
-        shutil.copytree(source_path, dest_path)
-        print(f"  ✅ Successfully installed to {dest_path}")
+        # 2. Copy source to destination (main() has created the parent)
+        files, dirs = _fast_copytree(source_path, dest_path, link=link)
+        _write_manifest(dest_path, link, files)
+        _apply_dir_metadata(dirs)
+        log(f"  ✅ Successfully installed to {dest_path}")
         return True
         
     except Exception as e:
-        print(f"  ❌ Error installing {skill_name}: {e}")
+        log(f"  ❌ Error installing {skill_name}: {e}")
         return False
 
-def remove_skill(skill_name, dest_path):
+def remove_skill(skill_name, dest_path, log=print):
     """Remove a single skill."""
-    print(f"Removing '{skill_name}'...")
+    log(f"Removing '{skill_name}'...")
     
-    if not dest_path.exists():
-        print(f"  Warning: Skill '{skill_name}' is not installed (path {dest_path} not found). Skipping.")
-        return False
-        
     try:
-        shutil.rmtree(dest_path)
-        print(f"  ✅ Successfully removed {dest_path}")
+        _fast_rmtree(dest_path)
+        log(f"  ✅ Successfully removed {dest_path}")
         return True
+    except FileNotFoundError:
+        log(f"  Warning: Skill '{skill_name}' is not installed (path {dest_path} not found). Skipping.")
+        return False
     except Exception as e:
-        print(f"  ❌ Error removing {skill_name}: {e}")
+        log(f"  ❌ Error removing {skill_name}: {e}")
         return False
 
-def main():
+def remove_all_skills(dest_root, skill_names):
+    """Remove every skill from a destination that holds only skills; return the count removed.
+
+    Only the contents are deleted, so a symlinked or mounted destination and its
+    mode, ownership and ACLs are left as they are.
+    """
+    print(f"Removing all skills in {dest_root}...")
+    try:
+        _rmtree_contents(os.fspath(dest_root))
+        print(f"  ✅ Successfully removed {len(skill_names)} skills")
+    except OSError as e:
+        print(f"  ❌ Error removing skills from {dest_root}: {e}")
+    return len(skill_names) - len(list_skill_dirs(dest_root))
+
+def _prefetch_tree(root):
+    """Stat every file below root so its metadata is cached before it is copied."""
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            try:
+                os.stat(os.path.join(dirpath, name))
+            except OSError:
+                pass
+
+def prefetch_metadata(source_root, skill_names):
+    """Start warming the inode cache for the given skills; return the executor."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=16)
+    for skill_name in skill_names:
+        executor.submit(_prefetch_tree, os.path.join(source_root, skill_name))
+    return executor
+
+def _run_buffered(func, *args):
+    """Run func with its output buffered, then print it as one block."""
+    lines = []
+    try:
+        return func(*args, log=lines.append)
+    finally:
+        with _print_lock:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+def run_parallel(func, jobs):
+    """Run func over each job's arguments in a thread pool; return the success count."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        futures = [executor.submit(_run_buffered, func, *job) for job in jobs]
+        return sum(1 for future in as_completed(futures) if future.result())
+
+def build_parser():
+    """Build the full argparse parser, used for --help and error reporting."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Unified Skills Manager for Open Code, Antigravity, and Claude Code.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -150,6 +476,22 @@ Examples:
     install_parser = subparsers.add_parser("install", help="Install or update skills")
     install_parser.add_argument("skill", nargs="?", help="Name of the skill to install")
     install_parser.add_argument("-a", "--all", action="store_true", help="Install ALL available skills")
+    install_parser.add_argument(
+        "--link",
+        action="store_true",
+        help="Hard link files instead of copying them when source and destination share a filesystem "
+             "(edits to installed files then also change the source)"
+    )
+    install_parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Stat source files in the background to warm a cold filesystem cache"
+    )
+    install_parser.add_argument(
+        "-f", "--force",
+        action="store_true",
+        help="Reinstall even if the source files are unchanged since the last install"
+    )
 
     # List Command
     subparsers.add_parser("list", help="List installed skills")
@@ -159,11 +501,63 @@ Examples:
     remove_parser.add_argument("skill", nargs="?", help="Name of the skill to remove")
     remove_parser.add_argument("-a", "--all", action="store_true", help="Remove ALL installed skills")
 
-    args = parser.parse_args()
+    return parser
 
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
+# Per-command flags understood by parse_args_fast, mapped to their dest names
+_COMMAND_FLAGS = {
+    "install": {"-a": "all", "--all": "all", "--link": "link", "--prefetch": "prefetch", "-f": "force", "--force": "force"},
+    "list": {},
+    "remove": {"-a": "all", "--all": "all"},
+}
+
+def parse_args_fast(argv):
+    """Parse the common command lines without importing argparse.
+
+    Returns None for anything it does not fully understand (including --help
+    and invalid values) so the caller can fall back to build_parser().
+    """
+    options = {"target": None, "scope": "global", "command": None}
+    flags = {}
+    args = iter(argv)
+    for arg in args:
+        name, sep, value = arg.partition("=")
+        if name in ("--target", "--scope"):
+            options[name[2:]] = value if sep else next(args, None)
+        elif options["command"] is None:
+            if arg not in _COMMAND_FLAGS:
+                return None
+            options["command"] = arg
+            flags = _COMMAND_FLAGS[arg]
+            if flags:
+                options["skill"] = None
+                options.update(dict.fromkeys(flags.values(), False))
+        elif arg in flags:
+            options[flags[arg]] = True
+        elif arg[:1] != "-" and options.get("skill", "") is None:
+            options["skill"] = arg
+        else:
+            return None
+
+    if (options["command"] is None
+            or options["target"] not in ("opencode", "antigravity", "claude-code")
+            or options["scope"] not in ("global", "workspace")):
+        return None
+    return types.SimpleNamespace(**options)
+
+def main():
+    # Block-buffer stdout even on a terminal; output is flushed once at exit
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
+    args = parse_args_fast(sys.argv[1:])
+    if args is None:
+        # Help, errors and unusual spellings get argparse's full handling
+        parser = build_parser()
+        args = parser.parse_args()
+
+        if not args.command:
+            parser.print_help()
+            sys.exit(1)
 
     # Validate scope for opencode and claude-code
     if args.target in ["opencode", "claude-code"] and args.scope == "workspace":
@@ -190,23 +584,31 @@ Examples:
             sys.exit(1)
             
         if args.all:
-            # Exclude installer directories
-            skills_to_install = [
-                d.name for d in source_root.iterdir() 
-                if d.is_dir() 
-                and not d.name.startswith(".") 
-                and d.name not in ["skills-manager", "antigravity-installer", "opencode-installer"]
-            ]
+            skills_to_install = list_skill_dirs(source_root, exclude=_EXCLUDED_DIRS)
             print(f"Found {len(skills_to_install)} skills to install.")
         else:
             skills_to_install = [args.skill]
 
-        success_count = 0
-        for skill_name in skills_to_install:
-            src = source_root / skill_name
-            dst = dest_root / skill_name
-            if install_skill(skill_name, src, dst):
-                success_count += 1
+        # Warm source metadata concurrently with the copies below
+        prefetcher = prefetch_metadata(source_root, skills_to_install) if args.prefetch else None
+
+        # Create the destination root once rather than once per skill
+        try:
+            dest_root.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Error: Could not create destination directory {dest_root}: {e}")
+            sys.exit(1)
+
+        link = args.link and same_filesystem(source_root, dest_root)
+        if args.link and not link:
+            print("Warning: --link needs source and destination on the same filesystem. Copying instead.")
+
+        success_count = run_parallel(install_skill, [
+            (skill_name, source_root / skill_name, dest_root / skill_name, link, args.force)
+            for skill_name in skills_to_install
+        ])
+        if prefetcher is not None:
+            prefetcher.shutdown(wait=False, cancel_futures=True)
         print("=" * 60)
         print(f"Done. Installed {success_count}/{len(skills_to_install)} skills.")
 
@@ -220,21 +622,29 @@ Examples:
                 print("No skills to remove.")
                 sys.exit(0)
                 
-            skills_to_remove = [
-                d.name for d in dest_root.iterdir() 
-                if d.is_dir() and not d.name.startswith(".")
-            ]
+            skills_to_remove = list_skill_dirs(dest_root)
             print(f"Found {len(skills_to_remove)} skills to remove.")
         else:
             skills_to_remove = [args.skill]
 
-        success_count = 0
-        for skill_name in skills_to_remove:
-            dst = dest_root / skill_name
-            if remove_skill(skill_name, dst):
-                success_count += 1
+        if args.all and skills_to_remove and len(skills_to_remove) == len(os.listdir(dest_root)):
+            # Nothing else lives in the destination, so drop it as a whole
+            success_count = remove_all_skills(dest_root, skills_to_remove)
+        else:
+            success_count = run_parallel(remove_skill, [
+                (skill_name, dest_root / skill_name)
+                for skill_name in skills_to_remove
+            ])
         print("=" * 60)
         print(f"Done. Removed {success_count}/{len(skills_to_remove)} skills.")
 
+    # Wait for background deletions of replaced installations and report failures
+    for executor in _executors.values():
+        executor.shutdown(wait=True)
+    for staging, future in _cleanup_futures:
+        if future.exception() is not None:
+            print(f"Warning: Could not delete replaced installation at {staging}: {future.exception()}")
+    sys.stdout.flush()
+
 if __name__ == "__main__":
     main()